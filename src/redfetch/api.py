@@ -2,6 +2,7 @@
 import requests
 import keyring
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # local
 from redfetch.auth import KEYRING_SERVICE_NAME, authorize
@@ -9,6 +10,23 @@ from redfetch.auth import KEYRING_SERVICE_NAME, authorize
 # Constants
 BASE_URL = os.environ.get('REDFETCH_BASE_URL', 'https://www.redguides.com/community')
 
+def _max_concurrent_requests(default=8):
+    """Reads REDFETCH_MAX_CONNECTIONS, falling back to the default on a bad value so importing never fails."""
+    try:
+        return max(1, int(os.environ.get('REDFETCH_MAX_CONNECTIONS', default)))
+    except ValueError:
+        return default
+
+# Upper bound on parallel requests for batched resource fetches, and the kept-alive pool that serves them
+MAX_CONCURRENT_REQUESTS = _max_concurrent_requests()
+
+# One keep-alive session for every API call, so paginated and batched fetches reuse the connection
+session = requests.Session()
+session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=MAX_CONCURRENT_REQUESTS))
+
+# /api/me payloads keyed by API key, so the user ID and username share one request
+_me_cache = {}
+
 def get_api_headers():
     """Fetches API details and returns the constructed headers for requests."""
     api_key = os.environ.get('REDGUIDES_API_KEY')
@@ -35,7 +53,7 @@ def fetch_all_resources(headers):
     all_resources = []
 
     while True:
-        response = requests.get(f'{BASE_URL}/api/resources/?page={page}', headers=headers)
+        response = session.get(f'{BASE_URL}/api/resources/?page={page}', headers=headers)
         if response.ok:
             data = response.json()
             resources = data['resources']
@@ -56,7 +74,7 @@ def fetch_watched_resources(headers):
     rgwatched_resources = []
 
     while True:
-        response = requests.get(f"{url}?page={page}", headers=headers)
+        response = session.get(f"{url}?page={page}", headers=headers)
         if response.ok:
             data = response.json()
             # Filter to include only resources that can be downloaded and have files
@@ -81,7 +99,7 @@ def fetch_licenses(headers):
     all_licenses = []
 
     while True:
-        response = requests.get(f"{url}?page={page}", headers=headers)
+        response = session.get(f"{url}?page={page}", headers=headers)
         if response.ok:
             data = response.json()
             # Filter licenses to include only those with downloadable resources and files
@@ -102,7 +120,7 @@ def fetch_licenses(headers):
 def fetch_single_resource(resource_id, headers):
     """Fetches a single resource from the API, ensuring it is downloadable and has files."""
     url = f'{BASE_URL}/api/resources/{resource_id}'
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     if response.ok:
         resource_data = response.json()
         resource = resource_data['resource']
@@ -116,13 +134,15 @@ def fetch_single_resource(resource_id, headers):
         return None
 
 def fetch_single_resource_batch(resource_ids, headers):
-    """Fetches single resource details for a set of resource IDs using the API. Slow."""
-    resources = []
-    for res_id in resource_ids:
-        resource_data = fetch_single_resource(res_id, headers)
-        if resource_data:
-            resources.append(resource_data)
-    return resources
+    """Fetches single resource details for a set of resource IDs using the API, a few requests at a time."""
+    resource_ids = list(resource_ids)
+    if len(resource_ids) <= 1:
+        results = [fetch_single_resource(res_id, headers) for res_id in resource_ids]
+    else:
+        # Requests are network-bound, so overlap them; map keeps the input order
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(resource_ids))) as executor:
+            results = list(executor.map(lambda res_id: fetch_single_resource(res_id, headers), resource_ids))
+    return [resource_data for resource_data in results if resource_data]
 
 def is_kiss_downloadable(headers):
     """Checks for level 2 access, since XF doesn't expose secondary_groups to non-admin api"""
@@ -132,36 +152,48 @@ def is_kiss_downloadable(headers):
 def fetch_versions_info(resource_id, headers):
     # fetch individual resource data from the API
     url = f'{BASE_URL}/api/resources/{resource_id}/versions'
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     response.raise_for_status()  # Raise an exception for 4xx or 5xx status codes
     return response.json()
 
-def fetch_user_id_from_api(api_key):
-    """Fetches the user ID from the API using the provided API key."""
+def fetch_me(api_key):
+    """Fetches the /api/me payload once per API key and reuses it for later lookups."""
+    if api_key in _me_cache:
+        return _me_cache[api_key]
     url = f'{BASE_URL}/api/me'
     headers = {'XF-Api-Key': api_key}
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     if response.ok:
-        user_id = response.json()['me']['user_id']
-        return user_id
+        me = response.json()['me']
+        _me_cache[api_key] = me
+        return me
     else:
-        print("Failed to retrieve user ID.")
         print(response.text)
         return None
 
+def clear_me_cache():
+    """Forgets cached /api/me payloads, for when the stored credentials change."""
+    _me_cache.clear()
+
+def fetch_user_id_from_api(api_key):
+    """Fetches the user ID from the API using the provided API key."""
+    me = fetch_me(api_key)
+    if me:
+        return me['user_id']
+    else:
+        print("Failed to retrieve user ID.")
+        return None
+
 def fetch_username(api_key, cache=True):
     """Fetches the username from the API using the provided API key."""
-    url = f'{BASE_URL}/api/me'
-    headers = {'XF-Api-Key': api_key}
-    response = requests.get(url, headers=headers)
-    if response.ok:
-        username = response.json()['me']['username']
+    me = fetch_me(api_key)
+    if me:
+        username = me['username']
         if cache:
             keyring.set_password(KEYRING_SERVICE_NAME, 'username', username)
         return username
     else:
         print("Failed to retrieve username.")
-        print(response.text)
         return "Unknown"
 
 def get_username():
@@ -112,6 +112,7 @@ def authorize():
         return  # Exit if the API key is valid and cached
     else:
         print("Looks like we need to get a new API key.")
+        clear_cached_user()
         if token_is_valid():
             print("Token is still valid, attempting to refresh or reauthorize for a new API key.")
             if data.get('refresh_token'):
@@ -235,6 +236,12 @@ def get_cached_tokens():
     data['user_id'] = keyring.get_password(KEYRING_SERVICE_NAME, 'user_id')
     return data
 
+def clear_cached_user():
+    """Drop the cached /api/me lookups so a new login doesn't reuse the old user_id or username."""
+    # api imports this module, so import it here
+    from redfetch import api
+    api.clear_me_cache()
+
 def logout():
     """Clear stored credentials from keyring."""
     credentials = ['access_token', 'refresh_token', 'expires_at', 'api_key', 'username', 'user_id']
@@ -248,6 +255,8 @@ def logout():
             # Credential not found, nothing to delete
             pass
 
+    clear_cached_user()
+
     if credentials_deleted:
         print("You have been logged out successfully.")
     else:
@@ -81,10 +81,12 @@ os.environ['REDFETCH_SCRIPT_DIR'] = script_dir
 config_dir = None
 env_file_path = None
 settings = None
+# Bumped whenever settings change in-process, so derived caches know to rebuild
+settings_version = 0
 
 def initialize_config():
     """Initialize configuration settings."""
-    global config_dir, env_file_path, settings  # Declare globals to modify them
+    global config_dir, env_file_path, settings, settings_version  # Declare globals to modify them
 
     # Perform first-run setup
     config_dir = first_run_setup()
@@ -123,11 +125,14 @@ def initialize_config():
         ]
     )
 
+    settings_version += 1
+
     # Return the settings object for potential use
     return settings
 
 def switch_environment(new_env):
     """Switch the environment and update the settings."""
+    global settings_version
     if settings is None:
         raise RuntimeError("Configuration has not been initialized. Call initialize_config() first.")
 
@@ -143,6 +148,7 @@ def switch_environment(new_env):
 
     # Update the from_env object to reflect the new environment
     settings.from_env(new_env).ENV = new_env
+    settings_version += 1
 
     # Re-validate settings after environment switch
     try:
@@ -175,6 +181,7 @@ def save_config(file_path, config_data):
 def update_setting(setting_path, setting_value, env=None):
     """Update a specific setting in the settings.local.toml file and in memory,
     optionally within a specific environment."""
+    global settings_version
     if settings is None or config_dir is None:
         raise RuntimeError("Configuration has not been initialized. Call initialize_config() first.")
 
@@ -217,6 +224,7 @@ def update_setting(setting_path, setting_value, env=None):
 
     save_config(config_file, config_data)
     settings.reload()
+    settings_version += 1
 
     print("Configuration saved.")
 
@@ -2,91 +2,157 @@
 import sqlite3
 import time
 import os
+from functools import lru_cache
+
+# third-party
+from rich import print as rprint
+from rich.markup import escape
+from rich.table import Table
+
+# Database paths whose schema has already been set up by this process
+_initialized_dbs = set()
+
+# Applied to every connection in one call; WAL lets the TUI read while a sync writes,
+# and mmap serves reads from the OS page cache (builds without mmap ignore it)
+PRAGMA_SCRIPT = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+"""
+
+# A sync leaves its pages in the WAL; past this size, fold them back into the database file
+WAL_CHECKPOINT_BYTES = 16 * 1024 * 1024
+
+def get_db_path(db_name):
+    """Returns the path of the specified SQLite database in the config directory."""
+    return os.path.join(os.getenv('REDFETCH_CONFIG_DIR'), db_name)
 
 def get_db_connection(db_name):
     """Establishes a database connection to the specified SQLite database in the script directory."""
-    config_dir = os.getenv('REDFETCH_CONFIG_DIR')
-    db_path = os.path.join(config_dir, db_name)
-    return sqlite3.connect(db_path)
+    db_path = get_db_path(db_name)
+    # IMMEDIATE takes the write lock when the implicit transaction opens, instead of upgrading mid-write
+    conn = sqlite3.connect(db_path, isolation_level="IMMEDIATE")
+    conn.executescript(PRAGMA_SCRIPT)
+    return conn
+
+def checkpoint_wal_if_large(db_name):
+    """Checkpoints and truncates the WAL after bulk writes, only once it has outgrown WAL_CHECKPOINT_BYTES."""
+    try:
+        if os.path.getsize(get_db_path(db_name) + '-wal') <= WAL_CHECKPOINT_BYTES:
+            return
+    except OSError:
+        return  # No WAL file, nothing to checkpoint
+    conn = get_db_connection(db_name)
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
 
 def ensure_column_exists(cursor, table_name, column_name, data_type):
-    cursor.execute(f"PRAGMA table_info({table_name})")
-    columns = [info[1] for info in cursor.fetchall()]
-    if column_name not in columns:
+    # Adding the column and catching the duplicate is one statement, instead of probing PRAGMA table_info first
+    try:
         cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {data_type}")
+    except sqlite3.OperationalError as e:
+        if 'duplicate column name' not in str(e):
+            raise
+
+# Idempotent schema setup, run as one script
+SCHEMA_SCRIPT = """
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS resources (
+        resource_id INTEGER PRIMARY KEY,
+        parent_category_id INTEGER,
+        remote_version INTEGER,
+        local_version INTEGER DEFAULT 0,
+        title TEXT,
+        tag_line TEXT,
+        view_url TEXT,
+        filename TEXT,
+        download_url TEXT,
+        is_watching BOOLEAN DEFAULT FALSE,
+        is_special BOOLEAN DEFAULT FALSE,
+        lic_active BOOLEAN,
+        lic_start_date INTEGER,
+        lic_end_date INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS dependencies (
+        parent_resource_id INTEGER,
+        dependency_resource_id INTEGER,
+        remote_version INTEGER,
+        local_version INTEGER DEFAULT 0,
+        title TEXT,
+        tag_line TEXT,
+        view_url TEXT,
+        filename TEXT,
+        download_url TEXT,
+        is_watching BOOLEAN DEFAULT FALSE,
+        lic_active BOOLEAN,
+        lic_start_date INTEGER,
+        lic_end_date INTEGER,
+        PRIMARY KEY (parent_resource_id, dependency_resource_id)
+    );
+    CREATE TABLE IF NOT EXISTS metadata (
+        id INTEGER PRIMARY KEY,
+        last_fetch_time INTEGER
+    );
+    -- Dependency rows are looked up by their own ID when resolving titles; the primary key only covers the parent
+    CREATE INDEX IF NOT EXISTS idx_dependencies_dependency_id ON dependencies (dependency_resource_id);
+    -- Initialize metadata with a very old timestamp if not already set
+    INSERT INTO metadata (id, last_fetch_time) SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM metadata WHERE id = 1);
+    COMMIT;
+"""
 
 def initialize_db(db_name):
+    """Creates or migrates the schema, once per database per process."""
+    db_path = get_db_path(db_name)
+    if db_path in _initialized_dbs and os.path.exists(db_path):
+        return
     with get_db_connection(db_name) as conn:
+        conn.executescript(SCHEMA_SCRIPT)
         cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS resources (
-                resource_id INTEGER PRIMARY KEY,
-                parent_category_id INTEGER,
-                remote_version INTEGER,
-                local_version INTEGER DEFAULT 0,
-                title TEXT,
-                tag_line TEXT,
-                view_url TEXT,
-                filename TEXT,
-                download_url TEXT,
-                is_watching BOOLEAN DEFAULT FALSE,
-                is_special BOOLEAN DEFAULT FALSE,
-                lic_active BOOLEAN,
-                lic_start_date INTEGER,
-                lic_end_date INTEGER
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS dependencies (
-                parent_resource_id INTEGER,
-                dependency_resource_id INTEGER,
-                remote_version INTEGER,
-                local_version INTEGER DEFAULT 0,
-                title TEXT,
-                tag_line TEXT,
-                view_url TEXT,
-                filename TEXT,
-                download_url TEXT,
-                is_watching BOOLEAN DEFAULT FALSE,
-                lic_active BOOLEAN,
-                lic_start_date INTEGER,
-                lic_end_date INTEGER,
-                PRIMARY KEY (parent_resource_id, dependency_resource_id)
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS metadata (
-                id INTEGER PRIMARY KEY,
-                last_fetch_time INTEGER
-            )
-        ''')
 
         # Ensure new columns exist
         ensure_column_exists(cursor, "resources", "remote_version", "INTEGER")
         ensure_column_exists(cursor, "dependencies", "remote_version", "INTEGER")
         ensure_column_exists(cursor, "resources", "is_special", "BOOLEAN")
 
-        # Initialize metadata with a very old timestamp if not already set
-        cursor.execute("INSERT INTO metadata (id, last_fetch_time) SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM metadata WHERE id = 1)")
-
-def insert_resource_or_dependency(cursor, table, data):
-    columns = ', '.join(data.keys())
-    placeholders = ', '.join(['?'] * len(data))
-    values = list(data.values())
-
-    if table == "resources":
-        cursor.execute(f"""
-            INSERT INTO resources ({columns}) VALUES ({placeholders})
-            ON CONFLICT(resource_id) DO UPDATE SET
-            {', '.join([f"{key} = excluded.{key}" for key in data.keys() if key != 'resource_id'])}
-        """, values)
+        # Refresh planner statistics where they are stale, so the indexes above get picked
+        cursor.execute("PRAGMA optimize")
+    _initialized_dbs.add(db_path)
+
+# Conflict target for each upsertable table
+UPSERT_KEYS = {
+    "resources": ('resource_id',),
+    "dependencies": ('parent_resource_id', 'dependency_resource_id'),
+}
+
+@lru_cache(maxsize=32)
+def get_upsert_sql(table, columns):
+    """Builds the upsert statement for a table and column tuple once, so sqlite3's statement cache keeps hitting."""
+    keys = UPSERT_KEYS[table]
+    return f"""
+        INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})
+        ON CONFLICT({', '.join(keys)}) DO UPDATE SET
+        {', '.join([f"{key} = excluded.{key}" for key in columns if key not in keys])}
+    """
+
+def insert_resource_or_dependency(cursor, table, data, batch=None):
+    if table not in UPSERT_KEYS:
+        return
+    if batch is not None:
+        # Queue the row for flush_resource_batch, grouped so each statement shape is prepared once
+        batch.setdefault((table, tuple(data.keys())), []).append(tuple(data.values()))
+    else:
+        cursor.execute(get_upsert_sql(table, tuple(data.keys())), list(data.values()))
 
-    elif table == "dependencies":
-        cursor.execute(f"""
-            INSERT INTO dependencies ({columns}) VALUES ({placeholders})
-            ON CONFLICT(parent_resource_id, dependency_resource_id) DO UPDATE SET
-            {', '.join([f"{key} = excluded.{key}" for key in data.keys() if key not in ('parent_resource_id', 'dependency_resource_id')])}
-        """, values)
+def flush_resource_batch(cursor, batch):
+    """Writes rows queued by insert_resource_or_dependency, one executemany per table and column set."""
+    for (table, columns), rows in batch.items():
+        cursor.executemany(get_upsert_sql(table, columns), rows)
+    batch.clear()
 
 def prepare_resource_data(resource, is_special=False, license_details=None):
     """ Prepare the data dictionary for inserting a resource, including license details. """
@@ -131,19 +197,19 @@ def prepare_dependency_data(resource, parent_id, license_details=None):
         })
     return data
 
-def insert_prepared_resource(cursor, resource, is_special, is_dependency, parent_id, current_ids=None, license_details=None):
+def insert_prepared_resource(cursor, resource, is_special, is_dependency, parent_id, current_ids=None, license_details=None, batch=None):
     resource_id = resource['resource_id']
 
     if is_special or not is_dependency:
         #for normal and special resources
         data = prepare_resource_data(resource, is_special, license_details)  
-        insert_resource_or_dependency(cursor, "resources", data)
+        insert_resource_or_dependency(cursor, "resources", data, batch)
         if current_ids is not None:
             current_ids.add((None, resource_id))  # None signifies no parent
 
     if is_dependency:
         dependency_data = prepare_dependency_data(resource, parent_id, license_details)
-        insert_resource_or_dependency(cursor, "dependencies", dependency_data)
+        insert_resource_or_dependency(cursor, "dependencies", dependency_data, batch)
         dependency_info = (parent_id, resource_id)
         if current_ids is not None:
             current_ids.add(dependency_info)
@@ -158,44 +224,63 @@ def clean_up_unnecessary_resources(cursor, current_ids):
     all_resource_ids = resource_ids.union(parent_ids)
     dependency_ids = {(pid, rid) for pid, rid in current_ids if pid is not None}
 
-    # Update resources table to set is_watching to FALSE for those not in all_resource_ids
     if all_resource_ids:
+        # Load the IDs to keep into a temp table once, instead of binding them into every NOT IN (...)
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id INTEGER PRIMARY KEY)")
+        cursor.execute("DELETE FROM temp.keep_ids")
+        cursor.executemany("INSERT OR IGNORE INTO temp.keep_ids (id) VALUES (?)", [(rid,) for rid in all_resource_ids])
+
         # Fetch the IDs of resources erroneously marked as watching
-        cursor.execute("SELECT resource_id FROM resources WHERE is_watching = TRUE AND resource_id NOT IN ({})".format(','.join('?' * len(all_resource_ids))), tuple(all_resource_ids))
+        cursor.execute("SELECT resource_id FROM resources WHERE is_watching = TRUE AND resource_id NOT IN (SELECT id FROM temp.keep_ids)")
         erroneously_watching_resources = cursor.fetchall()
         if erroneously_watching_resources:
             print(f"Resources erroneously marked as watching: {[res[0] for res in erroneously_watching_resources]}")
 
         # Perform the update to correct the is_watching flag
-        cursor.execute("UPDATE resources SET is_watching = FALSE WHERE resource_id NOT IN ({})".format(','.join('?' * len(all_resource_ids))), tuple(all_resource_ids))
+        cursor.execute("UPDATE resources SET is_watching = FALSE WHERE resource_id NOT IN (SELECT id FROM temp.keep_ids)")
 
-    # Delete licensed resources that aren't downloadable (not in all_resource_ids, with a non-null lic_start_date)
-    if all_resource_ids:
-        cursor.execute("SELECT resource_id FROM resources WHERE lic_start_date IS NOT NULL AND resource_id NOT IN ({})".format(','.join('?' * len(all_resource_ids))), tuple(all_resource_ids))
-        resources_to_delete = cursor.fetchall()
+        # Delete licensed resources that aren't downloadable and special resources that are no longer current
+        cursor.execute("""
+            DELETE FROM resources
+            WHERE (lic_start_date IS NOT NULL OR is_special = TRUE) AND resource_id NOT IN (SELECT id FROM temp.keep_ids)
+            RETURNING resource_id, lic_start_date IS NOT NULL
+        """)
+        deleted_resources = cursor.fetchall()
+        resources_to_delete = [rid for rid, is_licensed in deleted_resources if is_licensed]
+        special_resources_to_delete = [rid for rid, is_licensed in deleted_resources if not is_licensed]
         if resources_to_delete:
-            print(f"Licensed resources to be removed from db: {[res[0] for res in resources_to_delete]}")
-
-        cursor.execute("DELETE FROM resources WHERE lic_start_date IS NOT NULL AND resource_id NOT IN ({})".format(','.join('?' * len(all_resource_ids))), tuple(all_resource_ids))
-    
-    # Delete special resources that are not in current_ids
-    if all_resource_ids:
-        cursor.execute("SELECT resource_id FROM resources WHERE is_special = TRUE AND resource_id NOT IN ({})".format(','.join('?' * len(all_resource_ids))), tuple(all_resource_ids))
-        special_resources_to_delete = cursor.fetchall()
+            print(f"Licensed resources to be removed from db: {resources_to_delete}")
         if special_resources_to_delete:
-            print(f"Special resources to be removed from db: {[res[0] for res in special_resources_to_delete]}")
-        cursor.execute("DELETE FROM resources WHERE is_special = TRUE AND resource_id NOT IN ({})".format(','.join('?' * len(all_resource_ids))), tuple(all_resource_ids))
+            print(f"Special resources to be removed from db: {special_resources_to_delete}")
+
+        cursor.execute("DROP TABLE temp.keep_ids")
 
     # Clean up dependencies table by deleting entries not in current_ids
     if dependency_ids:
-        # Fetch the IDs of dependencies about to be deleted for logging
-        placeholders = ', '.join(['(?, ?)'] * len(dependency_ids))
-        cursor.execute(f"SELECT parent_resource_id, dependency_resource_id FROM dependencies WHERE (parent_resource_id, dependency_resource_id) NOT IN ({placeholders})", [item for sublist in dependency_ids for item in sublist])
+        # Seek each row's pair in a keyed temp table instead of scanning a (?, ?) list per row
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS keep_pairs (
+                parent_resource_id INTEGER,
+                dependency_resource_id INTEGER,
+                PRIMARY KEY (parent_resource_id, dependency_resource_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("DELETE FROM temp.keep_pairs")
+        cursor.executemany("INSERT OR IGNORE INTO temp.keep_pairs VALUES (?, ?)", list(dependency_ids))
+        # Delete and log the dependencies in one pass
+        cursor.execute("""
+            DELETE FROM dependencies
+            WHERE NOT EXISTS (
+                SELECT 1 FROM temp.keep_pairs k
+                WHERE k.parent_resource_id = dependencies.parent_resource_id
+                AND k.dependency_resource_id = dependencies.dependency_resource_id
+            )
+            RETURNING parent_resource_id, dependency_resource_id
+        """)
         dependencies_to_delete = cursor.fetchall()
         if dependencies_to_delete:
             print(f"Dependencies to be removed from db: {dependencies_to_delete}")
-        # Perform the deletion
-        cursor.execute(f"DELETE FROM dependencies WHERE (parent_resource_id, dependency_resource_id) NOT IN ({placeholders})", [item for sublist in dependency_ids for item in sublist])
+        cursor.execute("DROP TABLE temp.keep_pairs")
 
     # As the final function in the update logic, we'll set last run time here.
     cursor.execute("UPDATE metadata SET last_fetch_time = ? WHERE id = 1", (int(time.time()),))
@@ -214,108 +299,122 @@ def reset_download_date_for_resource(cursor, resource_id):
     # Reset in the dependencies table where the resource is a parent
     cursor.execute("UPDATE dependencies SET local_version = 0 WHERE parent_resource_id = ?", (resource_id,))
 
-def fetch_dependencies_for_parent(parent_resource_id, cursor):
-    """Fetch detailed information for all dependencies of a specific parent resource."""
-    cursor.execute("""
-        SELECT d.dependency_resource_id as resource_id, r.parent_category_id, d.remote_version, d.local_version, 
-               d.parent_resource_id, d.download_url, d.filename
-        FROM dependencies d
-        JOIN resources r ON d.parent_resource_id = r.resource_id
-        WHERE d.parent_resource_id = ?
-    """, (parent_resource_id,))
-    return cursor.fetchall()
-
-def fetch_single_resource_details(resource_id, cursor):
-    """Fetch the detailed information about a single resource from the database."""
-    cursor.execute("""
-        SELECT resource_id, parent_category_id, remote_version, local_version, NULL as parent_resource_id, download_url, filename
-        FROM resources
-        WHERE resource_id = ?
-    """, (resource_id,))
-    return cursor.fetchone()
-
-def fetch_watched_resource_details(cursor):
-    """Fetch detailed information about resources from the database that are either watched, special, or have a license start date."""
-    cursor.execute("""
-        SELECT resource_id, parent_category_id, remote_version, local_version, NULL as parent_resource_id, download_url, filename
-        FROM resources
-        WHERE is_watching = TRUE OR is_special = TRUE OR lic_start_date IS NOT NULL
-    """)
-    return cursor.fetchall()
-
-def fetch_all_dependency_details(cursor):
-    """Fetch detailed information about dependencies from the database."""
-    cursor.execute("""
-        SELECT d.dependency_resource_id as resource_id, r.parent_category_id, d.remote_version, d.local_version, d.parent_resource_id, d.download_url, d.filename
-        FROM dependencies d
-        JOIN resources r ON d.parent_resource_id = r.resource_id
-    """)
-    return cursor.fetchall()
+def reset_download_dates_for_resources(cursor, resource_ids):
+    """Reset several resources and their dependencies with one UPDATE per table per chunk."""
+    resource_ids = [int(resource_id) for resource_id in resource_ids]
+    # Stay under SQLite's default bound-parameter limit
+    for start in range(0, len(resource_ids), 999):
+        chunk = resource_ids[start:start + 999]
+        placeholders = ', '.join('?' * len(chunk))
+        cursor.execute(f"UPDATE resources SET local_version = 0 WHERE resource_id IN ({placeholders}) RETURNING resource_id", chunk)
+        for (resource_id,) in cursor.fetchall():
+            print(f"Resource {resource_id} will be re-downloaded.")
+        cursor.execute(f"UPDATE dependencies SET local_version = 0 WHERE parent_resource_id IN ({placeholders})", chunk)
+
+WATCHED_RESOURCE_DETAILS_SQL = """
+    SELECT resource_id, parent_category_id, remote_version, local_version, NULL as parent_resource_id, download_url, filename
+    FROM resources
+    WHERE is_watching = TRUE OR is_special = TRUE OR lic_start_date IS NOT NULL
+"""
+
+ALL_DEPENDENCY_DETAILS_SQL = """
+    SELECT d.dependency_resource_id as resource_id, r.parent_category_id, d.remote_version, d.local_version, d.parent_resource_id, d.download_url, d.filename
+    FROM dependencies d
+    JOIN resources r ON d.parent_resource_id = r.resource_id
+"""
 
 def fetch_watched_db_resources(cursor):
     """Fetch IDs of watched resources and dependencies from the db."""
-    resources = fetch_watched_resource_details(cursor)
-    dependencies = fetch_all_dependency_details(cursor)
-    return resources + dependencies
-
-def fetch_single_db_resource(resource_id, cursor):
-    """Fetch detailed information about a single resource and all its dependencies from the database."""
-    resource = fetch_single_resource_details(resource_id, cursor)
-    dependencies = fetch_dependencies_for_parent(resource_id, cursor)
-    
-    # Ensure resource is a list before concatenation.
-    resource_list = [resource] if resource else []
-    return resource_list + dependencies
-
-def update_download_date(resource_id, remote_version, is_dependency=False, parent_resource_id=None, cursor=None):
-    if cursor is None:
-        raise ValueError("Database cursor is not provided")
-    if is_dependency:
-        # Update the local_version for a dependency
-        cursor.execute("""
+    # One statement instead of two; resources still come before dependencies
+    cursor.execute(f"{WATCHED_RESOURCE_DETAILS_SQL} UNION ALL {ALL_DEPENDENCY_DETAILS_SQL}")
+    return cursor.fetchall()
+
+def fetch_db_resources(resource_ids, cursor):
+    """Fetch several resources and their dependencies, each resource followed by its dependencies in request order."""
+    resource_ids = [int(resource_id) for resource_id in resource_ids]
+    unique_ids = list(dict.fromkeys(resource_ids))
+    resources = {}
+    dependencies = {}
+    # Each ID is bound twice, so stay under SQLite's default bound-parameter limit per statement
+    for start in range(0, len(unique_ids), 499):
+        chunk = unique_ids[start:start + 499]
+        placeholders = ', '.join('?' * len(chunk))
+        cursor.execute(f"""
+            SELECT resource_id, parent_category_id, remote_version, local_version, NULL as parent_resource_id, download_url, filename
+            FROM resources
+            WHERE resource_id IN ({placeholders})
+            UNION ALL
+            SELECT d.dependency_resource_id as resource_id, r.parent_category_id, d.remote_version, d.local_version,
+                   d.parent_resource_id, d.download_url, d.filename
+            FROM dependencies d
+            JOIN resources r ON d.parent_resource_id = r.resource_id
+            WHERE d.parent_resource_id IN ({placeholders})
+        """, chunk * 2)
+        for row in cursor.fetchall():
+            if row[4] is None:
+                resources[row[0]] = row
+            else:
+                dependencies.setdefault(row[4], []).append(row)
+
+    # Each resource is followed by its dependencies, in the order the IDs were requested
+    resource_data = []
+    for resource_id in resource_ids:
+        if resource_id in resources:
+            resource_data.append(resources[resource_id])
+        resource_data.extend(dependencies.get(resource_id, []))
+    return resource_data
+
+def apply_download_dates(cursor, updates):
+    """Writes queued (resource_id, remote_version, is_dependency, parent_resource_id) updates with one executemany per table."""
+    dependency_rows = [(remote_version, parent_resource_id, resource_id) for resource_id, remote_version, is_dependency, parent_resource_id in updates if is_dependency]
+    resource_rows = [(remote_version, resource_id) for resource_id, remote_version, is_dependency, _ in updates if not is_dependency]
+    if dependency_rows:
+        cursor.executemany("""
             UPDATE dependencies
             SET local_version = ?
             WHERE parent_resource_id = ? AND dependency_resource_id = ?""",
-            (remote_version, parent_resource_id, resource_id))
-    else:
-        # Update the local_version for a normal resource
-        cursor.execute("""
+            dependency_rows)
+    if resource_rows:
+        cursor.executemany("""
             UPDATE resources
             SET local_version = ?
             WHERE resource_id = ?""",
-            (remote_version, resource_id))
-        
-def list_resources(cursor):
-    cursor.execute("SELECT resource_id, title FROM resources")
-    resources = cursor.fetchall()
-    print("Resources:")
-    for resource_id, title in resources:
-        print(f"ID: {resource_id}, Title: {title}")
-
-def list_dependencies(cursor):
-    cursor.execute("SELECT dependency_resource_id, title FROM dependencies")
-    dependencies = cursor.fetchall()
-    print("Dependencies:")
-    for resource_id, title in dependencies:
-        print(f"ID: {resource_id}, Title: {title}")
+            resource_rows)
+    updates.clear()
+
+def fetch_resource_and_dependency_titles(cursor):
+    """Fetch (resource_id, title) rows for resources and dependencies in one query, split by table."""
+    cursor.execute("""
+        SELECT resource_id, title, 1 AS is_resource FROM resources
+        UNION ALL
+        SELECT dependency_resource_id, title, 0 FROM dependencies
+    """)
+    resources, dependencies = [], []
+    for resource_id, title, is_resource in cursor.fetchall():
+        (resources if is_resource else dependencies).append((resource_id, title))
+    return resources, dependencies
+
+def list_all(cursor):
+    """Print the resources and dependencies tables from a single query."""
+    resources, dependencies = fetch_resource_and_dependency_titles(cursor)
+    rprint(build_resource_table("Resources", resources), build_resource_table("Dependencies", dependencies))
+
+def build_resource_table(title, rows):
+    """Builds a Rich table of (resource_id, title) rows so the list renders in one print."""
+    table = Table(title=title, title_justify="left")
+    table.add_column("ID", justify="right")
+    table.add_column("Title")
+    for resource_id, resource_title in rows:
+        table.add_row(str(resource_id), escape(str(resource_title)))
+    return table
 
 def get_resource_title(cursor, resource_id):
     """Get the title for a resource ID from either resources or dependencies table."""
-    # Try resources table first
-    cursor.execute("""
-        SELECT title FROM resources 
-        WHERE resource_id = ?
-    """, (resource_id,))
-    result = cursor.fetchone()
-    
-    if result:
-        return result[0]
-        
-    # If not found, try dependencies table
+    # Resources table first, falling back to dependencies, in one statement
     cursor.execute("""
-        SELECT title FROM dependencies 
-        WHERE dependency_resource_id = ?
-    """, (resource_id,))
-    result = cursor.fetchone()
-    
-    return result[0] if result else None
\ No newline at end of file
+        SELECT COALESCE(
+            (SELECT title FROM resources WHERE resource_id = ?),
+            (SELECT title FROM dependencies WHERE dependency_resource_id = ? LIMIT 1)
+        )
+    """, (resource_id, resource_id))
+    return cursor.fetchone()[0]
@@ -10,11 +10,16 @@ from rich import print as rprint
 
 # local
 from redfetch import config
+from redfetch.api import session
 from redfetch.utils import (
     get_folder_path,
+    get_special_index,
     is_safe_path,
 )
 
+# Bytes read per write when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 #
 # download functions
 #
@@ -42,14 +47,22 @@ def download_file(download_url, file_path, headers):
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
     # Perform the file download
+    writing = False
     try:
-        download_response = requests.get(download_url, headers=headers)
-        download_response.raise_for_status()  # Raise an exception for 4xx or 5xx status codes
-        with open(file_path, 'wb') as file:
-            file.write(download_response.content)
-        print(f"Downloading file {file_path}")
+        # Shared with the API calls, so downloads reuse the connection the sync already opened.
+        # Streamed to disk in chunks so large zips are never held in memory whole.
+        with session.get(download_url, headers=headers, stream=True) as download_response:
+            download_response.raise_for_status()  # Raise an exception for 4xx or 5xx status codes
+            print(f"Downloading file {file_path}")
+            writing = True
+            with open(file_path, 'wb') as file:
+                for chunk in download_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
     except requests.exceptions.RequestException as e:
         print(f"Failed to download file from {download_url}: {str(e)}")
+        # Don't leave a truncated file behind for the next run to trust
+        if writing and os.path.exists(file_path):
+            os.remove(file_path)
         return False
     return True
 
@@ -76,8 +89,11 @@ def extract_and_discard_zip(zip_path, extract_to, resource_id, flatten=False):
             delete_zip_file(zip_path)
             return
 
-        # Load protected files for the resource
-        protected_files = config.settings.from_env(config.settings.ENV).PROTECTED_FILES_BY_RESOURCE.get(resource_id, [])
+        # Load protected files for the resource, keyed by lowercase name for case-insensitive lookups
+        protected_files = {
+            f.lower(): f
+            for f in config.settings.from_env(config.settings.ENV).PROTECTED_FILES_BY_RESOURCE.get(resource_id, [])
+        }
         if flatten:
             extract_flattened(zip_ref, extract_to, protected_files)
         else:
@@ -170,32 +186,22 @@ def delete_zip_file(zip_path):
 
 def get_flatten_status(resource_id, is_dependency, parent_resource_id):
     # Does the zip want to be flattened?
-    flatten = False
+    flatten_map = get_special_index()['flatten_map']
+    resource_id = str(resource_id)
     if is_dependency and parent_resource_id:
         # Check if the parent resource has specific settings for this dependency
-
-        parent_resource = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES.get(parent_resource_id)
-        if parent_resource and 'dependencies' in parent_resource:
-            dependencies = parent_resource['dependencies']
-            if resource_id in dependencies:
-                dependency_info = dependencies[resource_id]
-                if 'flatten' in dependency_info:
-                    return dependency_info['flatten']
+        key = (str(parent_resource_id), resource_id)
+        if key in flatten_map:
+            return flatten_map[key]
     # Check if the resource itself has a flatten setting
-    special_resource = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES.get(resource_id)
-    if special_resource and 'flatten' in special_resource:
-        flatten = special_resource['flatten']
-
-    return flatten
+    return flatten_map.get((None, resource_id), False)
 
 def is_protected(filename, target_path, protected_files):
-    # Overwrite protection for specified files
-    filename_lower = filename.lower()
-    protected_files_lower = [f.lower() for f in protected_files]
+    # Overwrite protection for specified files, protected_files maps lowercase name -> configured name
+    original_filename = protected_files.get(filename.lower())
 
-    if filename_lower in protected_files_lower and os.path.exists(target_path):
-        # Retrieve the original filename case for message consistency
-        original_filename = protected_files[protected_files_lower.index(filename_lower)]
+    if original_filename is not None and os.path.exists(target_path):
+        # Use the original filename case for message consistency
         print(f"Protected {original_filename}, skipping extraction.")
         return True
     return False
\ No newline at end of file
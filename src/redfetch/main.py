@@ -2,6 +2,7 @@
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # third-party imports
 from dynaconf import ValidationError
@@ -17,7 +18,9 @@ from redfetch import meta
 from redfetch import db
 from redfetch import download
 from redfetch import utils
-from redfetch import push
+
+# Downloads recorded per executemany while a sync is running
+DOWNLOAD_UPDATE_BATCH_SIZE = 64
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description="redfetch CLI.", formatter_class=RichHelpFormatter)
@@ -63,31 +66,37 @@ def get_special_resource_status(resource_ids=None):
         special_resource_status[res_id] = {
             'is_special': is_special,
             'is_dependency': is_dependency,
-            'parent_ids': set(parent_ids)
+            'parent_ids': parent_ids  # already unique, one entry per parent
         }
     #print(f"special_resource_status: {special_resource_status}")
     return special_resource_status
 
 def process_resources(cursor, resources):
     current_ids = set()
+    batch = {}
+    category_map = config.CATEGORY_MAP
     for resource in resources:
         if not resource:
             continue  # Skip None resources
         # Only add to the db if it's in an MQ category
-        if resource['Category']['parent_category_id'] in config.CATEGORY_MAP:
+        if resource['Category']['parent_category_id'] in category_map:
             db.insert_prepared_resource(
                 cursor,
                 resource,
                 is_special=False,
                 is_dependency=False,
                 parent_id=None,
-                license_details=None
+                license_details=None,
+                batch=batch
             )
             current_ids.add((None, resource['resource_id']))  # Add to current IDs
+    db.flush_resource_batch(cursor, batch)
     return current_ids
 
 def process_licensed_resources(cursor, licensed_resources):
     current_ids = set()
+    batch = {}
+    category_map = config.CATEGORY_MAP
     for license_info in licensed_resources:
         resource = license_info['resource']
         license_details = {
@@ -96,52 +105,60 @@ def process_licensed_resources(cursor, licensed_resources):
             'end_date': license_info.get('end_date'),
             'license_id': license_info['license_id']
         }
-        if resource['Category']['parent_category_id'] in config.CATEGORY_MAP:
+        if resource['Category']['parent_category_id'] in category_map:
             db.insert_prepared_resource(
                 cursor,
                 resource,
                 is_special=False,
                 is_dependency=False,
                 parent_id=None,
-                license_details=license_details
+                license_details=license_details,
+                batch=batch
             )
             current_ids.add((None, resource['resource_id']))  # Add to current IDs
+    db.flush_resource_batch(cursor, batch)
     return current_ids
 
 def process_special_resources(cursor, special_resource_status, special_resources_data):
     current_ids = set()
+    batch = {}
     for resource in special_resources_data:
         res_id = str(resource['resource_id'])
-        if res_id not in special_resource_status:
+        status = special_resource_status.get(res_id)
+        if status is None:
             continue
-        status = special_resource_status[res_id]
         is_special = status['is_special']
         is_dependency = status['is_dependency']
         parent_ids = status['parent_ids']
 
         if not parent_ids and is_special:  # Handle special resources with no dependencies
-            db.insert_prepared_resource(cursor, resource, is_special, is_dependency, parent_id=None, license_details=None)
+            db.insert_prepared_resource(cursor, resource, is_special, is_dependency, parent_id=None, license_details=None, batch=batch)
             current_ids.add((None, res_id))  # Add to current IDs without a parent ID
 
         for parent_id in parent_ids:
             current_ids.add((parent_id, res_id))
-            db.insert_prepared_resource(cursor, resource, is_special, is_dependency, parent_id, license_details=None)
+            db.insert_prepared_resource(cursor, resource, is_special, is_dependency, parent_id, license_details=None, batch=batch)
+    db.flush_resource_batch(cursor, batch)
     return current_ids
 
 def fetch_from_api(headers, resource_ids=None):
     if resource_ids is None:
-        # Fetch all watched resources if no specific IDs are provided
-        watched_resources = api.fetch_watched_resources(headers)
-        licensed_resources = api.fetch_licenses(headers)
-        special_resource_status = get_special_resource_status()
+        # Fetch all watched resources if no specific IDs are provided; the two paginated listings run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            watched_future = executor.submit(api.fetch_watched_resources, headers)
+            licensed_future = executor.submit(api.fetch_licenses, headers)
+            special_resource_status = get_special_resource_status()
+            watched_resources = watched_future.result()
+            licensed_resources = licensed_future.result()
+        # fetch each resource only once
+        special_resources_data = api.fetch_single_resource_batch(list(special_resource_status.keys()), headers)
     else:
-        # Fetch only the specified resources
-        watched_resources = [api.fetch_single_resource(rid, headers) for rid in resource_ids]
         licensed_resources = []  # Assuming no licenses for specific resource fetches
         special_resource_status = get_special_resource_status(resource_ids)
-        
-    # fetch each resource only once
-    special_resources_data = api.fetch_single_resource_batch(list(special_resource_status.keys()), headers)
+        # The status map holds the specified resources plus their dependencies, so fetch that union once
+        special_resources_data = api.fetch_single_resource_batch(list(special_resource_status.keys()), headers)
+        fetched_by_id = {str(resource['resource_id']): resource for resource in special_resources_data}
+        watched_resources = [fetched_by_id[str(rid)] for rid in resource_ids if str(rid) in fetched_by_id]
 
     return {
         'watched_resources': watched_resources,
@@ -157,7 +174,7 @@ def store_fetched_data(cursor, fetched_data):
 
     return current_ids
 
-def handle_resource_download(cursor, headers, resource):
+def handle_resource_download(cursor, headers, resource, pending_updates):
     try:
         resource_id, parent_category_id, remote_version, local_version, parent_resource_id, download_url, filename = resource
         resource_id = str(resource_id)
@@ -168,32 +185,23 @@ def handle_resource_download(cursor, headers, resource):
         title = db.get_resource_title(cursor, resource_id)
         resource_display = f"{title} (ID: {resource_id})" if title else f"resource {resource_id}"
 
-        if local_version is None or local_version < remote_version:
-            print(f"Downloading updates for {resource_display}.")
-            success = download.download_resource(
-                resource_id,
-                parent_category_id,
-                download_url,
-                filename,
-                headers,
-                is_dependency=bool(parent_resource_id),
-                parent_resource_id=parent_resource_id,
-            )
-            if success:
-                db.update_download_date(
-                    resource_id,
-                    remote_version,
-                    bool(parent_resource_id),
-                    parent_resource_id,
-                    cursor,
-                )
-                return 'downloaded'  # Indicate successful download
-            else:
-                print(f"Error occurred while downloading {resource_display}.")
-                return 'error'  # Indicate download error
+        print(f"Downloading updates for {resource_display}.")
+        success = download.download_resource(
+            resource_id,
+            parent_category_id,
+            download_url,
+            filename,
+            headers,
+            is_dependency=bool(parent_resource_id),
+            parent_resource_id=parent_resource_id,
+        )
+        if success:
+            # Queued for db.apply_download_dates, written in one batch by the caller
+            pending_updates.append((resource_id, remote_version, bool(parent_resource_id), parent_resource_id))
+            return 'downloaded'  # Indicate successful download
         else:
-            print(f"Skipping download for {resource_display} - no new updates since last download.")
-            return 'skipped'  # Indicate resource was up-to-date
+            print(f"Error occurred while downloading {resource_display}.")
+            return 'error'  # Indicate download error
     except KeyboardInterrupt:
         print(f"\nDownload of {resource_display} cancelled by user.")
         return 'cancelled'  # Indicate download was cancelled
@@ -211,10 +219,7 @@ def synchronize_db_and_download(cursor, headers, resource_ids=None, worker=None)
     
     # Fetch and download specific resource(s)
     if resource_ids is not None:
-        resource_data = []
-        for rid in original_resource_ids:
-            single_resource_data = db.fetch_single_db_resource(rid, cursor)
-            resource_data.extend(single_resource_data)  # Flatten the list of resources and dependencies
+        resource_data = db.fetch_db_resources(original_resource_ids, cursor)
     else:
         # Clean up the database when downloading watched resources
         db.clean_up_unnecessary_resources(cursor, current_ids)
@@ -222,27 +227,43 @@ def synchronize_db_and_download(cursor, headers, resource_ids=None, worker=None)
         resource_data = db.fetch_watched_db_resources(cursor)
     
     print(f"Total resources to process: >>> {len(resource_data)} <<<")
+
+    # Only rows with a newer remote version go through the per-resource path; the rest need no title lookup
+    skipped_count = len(resource_data)
+    resource_data = [resource for resource in resource_data if resource[3] is None or resource[3] < resource[2]]
+    skipped_count -= len(resource_data)
+    if skipped_count:
+        print(f"Skipping {skipped_count} resource(s) with no new updates since last download.")
     
     download_results = []
+    pending_updates = []
     try:
         for resource in resource_data:
             # Check if the worker has been cancelled
             if worker and worker.is_cancelled:
                 print("\nCancelling remaining downloads.")
                 return False  # Exit the function gracefully
-            result = handle_resource_download(cursor, headers, resource)
+            result = handle_resource_download(cursor, headers, resource, pending_updates)
             if result == 'cancelled':
                 print("\nCancelling remaining downloads.")
                 return False
             download_results.append((resource[0], result))  # Store resource_id and result
+            if len(pending_updates) >= DOWNLOAD_UPDATE_BATCH_SIZE:
+                db.apply_download_dates(cursor, pending_updates)
     except KeyboardInterrupt:
         print("\nDownload process was cancelled by user.")
         return False
+    finally:
+        # Record what did download, including on cancel
+        db.apply_download_dates(cursor, pending_updates)
     
-    # Separate resources based on the result
-    downloaded_resources = [res_id for res_id, res in download_results if res == 'downloaded']
-    skipped_resources = [res_id for res_id, res in download_results if res == 'skipped']
-    errored_resources = [res_id for res_id, res in download_results if res == 'error']
+    # Separate resources based on the result, in a single pass
+    results_by_status = {'downloaded': [], 'error': []}
+    for res_id, res in download_results:
+        if res in results_by_status:
+            results_by_status[res].append(res_id)
+    downloaded_resources = results_by_status['downloaded']
+    errored_resources = results_by_status['error']
 
     if errored_resources:
         print("One or more resources failed to download.")
@@ -256,6 +277,9 @@ def synchronize_db_and_download(cursor, headers, resource_ids=None, worker=None)
         return True
 
 def handle_push(args):
+    # push pulls in md2bbcode, so only import it for this command
+    from redfetch import push
+
     API_KEY = os.environ.get('REDGUIDES_API_KEY')
     # Ensure the user is authorized
     if not API_KEY:
@@ -363,14 +387,14 @@ def handle_fetch(args):
             print("Force download requested. All watched resources will be re-downloaded.")
             db.reset_download_dates(cursor)
         if args.list_resources:
-            db.list_resources(cursor)
-            db.list_dependencies(cursor)
+            db.list_all(cursor)
             return
         if args.download_resource:
             print(f"Downloading resource {args.download_resource}.")
             synchronize_db_and_download(cursor, headers, [args.download_resource])
         elif args.download_watched:
             handle_download_watched(cursor, headers)
+    db.checkpoint_wal_if_large(db_name)
 
 def handle_download_watched(cursor, headers):
     if utils.is_mq_down():
@@ -381,10 +405,10 @@ def handle_download_watched(cursor, headers):
             return False
 
     mq_folder = utils.get_base_path()
+    # Check auto-terminate setting first, "never" doesn't need the process scan
+    auto_terminate = config.settings.from_env(config.settings.ENV).get('AUTO_TERMINATE_PROCESSES', None)
     # Check if MQ or any other executable is running
-    if utils.are_executables_running_in_folder(mq_folder):
-        # Check auto-terminate setting
-        auto_terminate = config.settings.from_env(config.settings.ENV).get('AUTO_TERMINATE_PROCESSES', None)
+    if auto_terminate is not False and utils.are_executables_running_in_folder(mq_folder):
         if auto_terminate:
             utils.terminate_executables_in_folder(mq_folder)
         else:
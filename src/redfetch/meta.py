@@ -1,8 +1,10 @@
 # Standard
+import json
 import os
 import platform
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Third-party
@@ -13,7 +15,6 @@ from packaging import version
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.prompt import Confirm
 
 # Local
@@ -24,14 +25,72 @@ PYPI_URL = os.getenv("REDFETCH_PYPI_URL", "https://pypi.org/pypi/redfetch/json")
 
 console = Console()
 
+# Keep-alive session for PyPI lookups, with a short connect timeout so a slow index can't stall startup
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2))
+PYPI_TIMEOUT = (3.05, 10)
+
+# ETag/Last-Modified and version from the last PyPI check, stored in the config directory
+VERSION_CACHE_FILE = "pypi_version.json"
+
 def get_current_version():
     return __version__
 
+@lru_cache(maxsize=None)
 def fetch_latest_version_from_pypi():
-    response = requests.get(PYPI_URL)
+    """Fetches the latest published version once per process, revalidating the last answer when PyPI allows."""
+    cache_path = get_version_cache_path()
+    cached = load_version_cache(cache_path)
+
+    request_headers = {}
+    if cached.get('url') == PYPI_URL:
+        if cached.get('etag'):
+            request_headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            request_headers['If-Modified-Since'] = cached['last_modified']
+
+    response = _session.get(PYPI_URL, headers=request_headers, timeout=PYPI_TIMEOUT)
+    if response.status_code == 304:
+        # Unchanged since last time, skip downloading and decoding the JSON
+        return cached['version']
     response.raise_for_status()
     data = response.json()
-    return data['info']['version']
+    latest_version = data['info']['version']
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if cache_path and (etag or last_modified):
+        save_version_cache(cache_path, {
+            'url': PYPI_URL,
+            'etag': etag,
+            'last_modified': last_modified,
+            'version': latest_version,
+        })
+    return latest_version
+
+def get_version_cache_path():
+    config_dir = os.environ.get('REDFETCH_CONFIG_DIR')
+    if not config_dir:
+        return None
+    return os.path.join(config_dir, VERSION_CACHE_FILE)
+
+def load_version_cache(cache_path):
+    """Load the cached PyPI validators and version, or an empty dict if there are none."""
+    if not cache_path:
+        return {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        return cached if isinstance(cached, dict) and cached.get('version') else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_version_cache(cache_path, cached):
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cached, f)
+    except OSError:
+        pass  # Only an optimization, the next check just downloads the full JSON
 
 def get_executable_path():
     executable_path = os.environ.get('PYAPP')
@@ -106,7 +165,7 @@ def check_for_update():
             # Handle PYAPP separately
             if os.getenv('PYAPP'):
                 if Confirm.ask("Would you like to update now?"):
-                    return self_update()
+                    return self_update(latest_version)
                 else:
                     console.print("[yellow]Update skipped. You can manually update later.[/yellow]")
                 return False
@@ -138,50 +197,27 @@ def pip_update_redfetch(update_command, latest_version):
         
         console.print(f"\n[bold]Updating redfetch to version {latest_version} in {script_dir}[/bold]")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=console
-        ) as progress:
-            update_task = progress.add_task("[cyan]Updating redfetch...", total=100)
-            
-            process = subprocess.Popen(
-                update_command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    progress.update(update_task, advance=10)
-            
-            returncode = process.poll()
-        
+        # pip renders its own progress when it owns the terminal, so don't pipe it
+        returncode = subprocess.run(update_command, check=False).returncode
+
         if returncode == 0:
             console.print("[bold green]redfetch has been successfully updated. 🫎[/bold green]")
             return True
         else:
-            error_output = process.stderr.read()
-            console.print(f"[bold red]Error updating redfetch:[/bold red] {error_output}")
+            console.print(f"[bold red]Error updating redfetch:[/bold red] update command exited with code {returncode}")
             return False
     except Exception as e:
         console.print(f"[bold red]Error during update process:[/bold red] {e}")
         return False
 
-def self_update():
+def self_update(latest_version=None):
     """Update with PYAPP."""
     try:
         console.print("[bold]Performing self-update...[/bold]")
 
         current_version = get_current_version()
-        latest_version = fetch_latest_version_from_pypi()
+        if latest_version is None:
+            latest_version = fetch_latest_version_from_pypi()
         console.print(f"Current version: {current_version}")
         console.print(f"Latest version: {latest_version}")
 
@@ -274,20 +310,7 @@ def uninstall():
     console.print("\n[bold]Manual Cleanup Instructions:[/bold]\n")
 
     environments = ['DEFAULT', 'LIVE', 'TEST', 'EMU']  # List of environments to check
-    printed_paths = set()  # To avoid duplicates
-    existing_paths = set()  # Collect existing paths
-
-    def should_print_path(path):
-        """Determine if the path should be printed, avoiding nested paths."""
-        path = os.path.abspath(path)
-        for printed_path in printed_paths:
-            try:
-                if os.path.commonpath([path, printed_path]) == printed_path:
-                    return False
-            except ValueError:
-                # Paths on different drives; can't have a common path
-                continue
-        return True
+    candidate_paths = set()  # Existing paths, nested ones are dropped below
 
     for env in environments:
         env_settings = config.settings.from_env(env)
@@ -296,17 +319,14 @@ def uninstall():
         download_folder = env_settings.get('DOWNLOAD_FOLDER')
         if download_folder and os.path.exists(download_folder):
             download_folder = os.path.normpath(download_folder)
-            if should_print_path(download_folder):
-                existing_paths.add(download_folder)
-                printed_paths.add(download_folder)
+            candidate_paths.add(download_folder)
 
         # Get EQPath
         eq_path = env_settings.get('EQPATH')
         if eq_path:
             eq_path = os.path.normpath(os.path.join(eq_path, "maps"))
-            if os.path.exists(eq_path) and should_print_path(eq_path):
-                existing_paths.add(eq_path)
-                printed_paths.add(eq_path)
+            if os.path.exists(eq_path):
+                candidate_paths.add(eq_path)
 
         # Special resources
         special_resources = env_settings.get('SPECIAL_RESOURCES', {})
@@ -323,9 +343,8 @@ def uninstall():
                 paths.add(os.path.normpath(os.path.join(download_folder, default_path)))
 
             for path in paths:
-                if os.path.exists(path) and should_print_path(path):
-                    existing_paths.add(path)
-                    printed_paths.add(path)
+                if os.path.exists(path):
+                    candidate_paths.add(path)
 
     # Also inform about the configuration directory
     config_dir = os.environ.get('REDFETCH_CONFIG_DIR', '')
@@ -333,11 +352,12 @@ def uninstall():
         # Delete configuration files
         files_to_delete = [
             os.path.join(config_dir, '.env'),
-            os.path.join(config_dir, 'settings.local.toml')
+            os.path.join(config_dir, 'settings.local.toml'),
+            os.path.join(config_dir, VERSION_CACHE_FILE)
         ]
         
-        # Add any .db files
-        db_files = [f for f in os.listdir(config_dir) if f.endswith('.db')]
+        # Add any .db files, along with their WAL and shared-memory sidecars
+        db_files = [f for f in os.listdir(config_dir) if f.endswith(('.db', '.db-wal', '.db-shm'))]
         files_to_delete.extend([os.path.join(config_dir, f) for f in db_files])
         
         for file_path in files_to_delete:
@@ -347,9 +367,9 @@ def uninstall():
                 except Exception as e:
                     console.print(f"[red]Failed to delete {file_path}: {e}[/red]")
         
-        if should_print_path(config_dir):
-            existing_paths.add(config_dir)
-            printed_paths.add(config_dir)
+        candidate_paths.add(config_dir)
+
+    existing_paths = remove_nested_paths(candidate_paths)
 
     if existing_paths:
         console.print("The following directories may contain files downloaded by redfetch:")
@@ -379,6 +399,21 @@ def uninstall():
         # Optionally, exit the program
         sys.exit(0)
 
+def remove_nested_paths(paths):
+    """Return the paths that aren't inside another path in the set."""
+    # Sorting by path components puts every folder directly before its subfolders
+    keyed_paths = sorted(
+        (os.path.normcase(os.path.abspath(path)).rstrip(os.sep).split(os.sep), path) for path in paths
+    )
+    top_level_paths = set()
+    last_kept = None
+    for parts, path in keyed_paths:
+        if last_kept is not None and parts[:len(last_kept)] == last_kept:
+            continue
+        top_level_paths.add(path)
+        last_kept = parts
+    return top_level_paths
+
 def generate_removal_commands(paths, console):
     """Generate OS-specific commands to remove the given directories."""
     system = platform.system()
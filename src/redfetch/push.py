@@ -1,10 +1,12 @@
 import os
+import re
+from functools import lru_cache
 import requests
-import keepachangelog  # For parsing changelog
+from requests_toolbelt import MultipartEncoder  # For streaming file uploads
 from md2bbcode.main import process_readme  # For markdown to BBCode conversion
 
-# Import authentication functions
-from redfetch.api import get_api_headers
+# Import authentication functions and the shared API session
+from redfetch.api import get_api_headers, session
 
 # Constants
 BASE_URL = os.environ.get('REDFETCH_BASE_URL', 'https://www.redguides.com/community')
@@ -12,14 +14,27 @@ XF_API_URL = f'{BASE_URL}/api'
 URI_MESSAGE = f'{XF_API_URL}/resource-updates'
 URI_ATTACHMENT = f'{XF_API_URL}/attachments/new-key'
 URI_RESPONSE = f'{XF_API_URL}/resource-versions'
+URI_RESOURCE = f'{XF_API_URL}/resources/{{resource_id}}'
+
+# keepachangelog release headers like "## [1.2.3] - 2024-01-01", and "[1.2.3]: https://..." link definitions
+RELEASE_HEADER_PATTERN = re.compile(r'^##\s+\[?([^\]\s]+)\]?')
+LINK_DEFINITION_PATTERN = re.compile(r'^\[[^\]]+\]:\s')
+SUBSECTION_HEADER_PATTERN = re.compile(r'^###\s+(.+?)\s*$')
+
+@lru_cache(maxsize=1)
+def get_push_headers():
+    """
+    Returns the API headers, looked up once per push rather than for every request.
+    """
+    return get_api_headers()
 
 def get_resource_details(resource_id):
     """
     Retrieves details of a specific resource.
     """
-    url = f"{XF_API_URL}/resources/{resource_id}"
-    headers = get_api_headers()
-    response = requests.get(url, headers=headers)
+    url = URI_RESOURCE.format(resource_id=resource_id)
+    headers = get_push_headers()
+    response = session.get(url, headers=headers)
     response.raise_for_status()
     return response.json()['resource']
 
@@ -27,10 +42,10 @@ def update_resource_description(resource_id, new_description):
     """
     Updates the description of a resource.
     """
-    url = f"{XF_API_URL}/resources/{resource_id}"
+    url = URI_RESOURCE.format(resource_id=resource_id)
     payload = {'description': new_description}
-    headers = get_api_headers()
-    response = requests.post(url, headers=headers, data=payload)
+    headers = get_push_headers()
+    response = session.post(url, headers=headers, data=payload)
     response.raise_for_status()
     print("Successfully updated the resource description.")
 
@@ -39,13 +54,13 @@ def add_xf_message(resource, msg_title, message):
     Adds a new message (update) to the resource.
     """
     resource_id = resource['resource_id']
-    headers = get_api_headers()
+    headers = get_push_headers()
     form_message = {
         'resource_id': resource_id,
         'title': msg_title,
         'message': message
     }
-    response = requests.post(URI_MESSAGE, headers=headers, data=form_message)
+    response = session.post(URI_MESSAGE, headers=headers, data=form_message)
     response.raise_for_status()
     print(f"Response: {response.status_code}, {response.text}")
     return response.json()
@@ -55,19 +70,19 @@ def add_xf_attachment(resource, upfilename, version=None):
     Adds an attachment (file upload) to the resource.
     """
     resource_id = resource['resource_id']
-    headers = get_api_headers()
-
-    # Prepare the data for getting an attachment key and uploading the file
-    data = {
-        "type": "resource_version",
-        "context[resource_id]": resource_id
-    }
+    headers = get_push_headers()
 
     try:
         # Get an attachment key and also upload the file
         with open(upfilename, "rb") as file:
-            files = {"attachment": (os.path.basename(upfilename), file, "application/octet-stream")}
-            response = requests.post(URI_ATTACHMENT, headers=headers, data=data, files=files)
+            # Stream the multipart body from disk instead of building it in memory
+            encoder = MultipartEncoder(fields={
+                "type": "resource_version",
+                "context[resource_id]": str(resource_id),
+                "attachment": (os.path.basename(upfilename), file, "application/octet-stream"),
+            })
+            upload_headers = {**headers, "Content-Type": encoder.content_type}
+            response = session.post(URI_ATTACHMENT, headers=upload_headers, data=encoder)
             response.raise_for_status()
             content = response.json()
             attachKey = content.get("key")
@@ -80,7 +95,7 @@ def add_xf_attachment(resource, upfilename, version=None):
                 }
                 if version:
                     data_update["version_string"] = version
-                response_update = requests.post(URI_RESPONSE, headers=headers, data=data_update)
+                response_update = session.post(URI_RESPONSE, headers=headers, data=data_update)
                 response_update.raise_for_status()
                 print(f"Successfully added attachment for resource {resource_id}")
             else:
@@ -115,30 +130,39 @@ def read_file_content(file_path):
         content = f.read()
     return content
 
+def read_changelog_section(changelog_path, version_key):
+    """
+    Returns the markdown body of the changelog's release section for version_key, or None if it isn't there.
+    """
+    section = None
+    with open(changelog_path, encoding="utf-8") as change_log:
+        for line in change_log:
+            header = RELEASE_HEADER_PATTERN.match(line)
+            if header:
+                if section is not None:
+                    break
+                if header.group(1).lower() == version_key:
+                    section = []
+            elif section is not None and not LINK_DEFINITION_PATTERN.match(line):
+                subsection = SUBSECTION_HEADER_PATTERN.match(line)
+                if subsection:
+                    # keepachangelog capitalized subsection names, keep "### CHANGED" reading as "### Changed"
+                    line = f"### {subsection.group(1).capitalize()}\n"
+                section.append(line)
+    return "".join(section).strip() if section is not None else None
+
 def parse_changelog(changelog_path, version, domain=None):
     """
     Parses the changelog file and returns the changelog entry for the given version as BBCode.
     """
-    # Use keepachangelog to parse the changelog file
-    changes = keepachangelog.to_dict(changelog_path)
     # Remove 'v' prefix if present
     version_key = version.lstrip('v')
-    if version_key in changes:
-        # Flatten the change notes into a markdown string
-        version_data = changes[version_key]
-        markdown_lines = []
-        for section, notes in version_data.items():
-            if section != 'metadata':
-                markdown_lines.append(f"### {section.capitalize()}")
-                for note in notes:
-                    markdown_lines.append(f"- {note}")
-                markdown_lines.append("")  # Add a newline
-        markdown_message = "\n".join(markdown_lines)
-        # Convert markdown to BBCode
-        bbcode_message = convert_markdown_to_bbcode(markdown_message, domain=domain)
-        return bbcode_message
-    else:
+    # The release's markdown goes straight to md2bbcode, no need to rebuild it from a parsed dict
+    markdown_message = read_changelog_section(changelog_path, version_key.lower())
+    if markdown_message is None:
         raise ValueError(f"Version {version} not found in {changelog_path}")
+    # Convert markdown to BBCode
+    return convert_markdown_to_bbcode(markdown_message, domain=domain)
 
 def generate_version_message(args):
     """
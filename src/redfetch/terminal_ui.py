@@ -932,13 +932,12 @@ class Redfetch(App):
         
         # Check for running processes
         mq_folder = utils.get_base_path()
-        running_executables = utils.are_executables_running_in_folder(mq_folder)
+        auto_terminate = config.settings.from_env(self.current_env).get('AUTO_TERMINATE_PROCESSES', None)
+        # "never" skips the process scan entirely
+        running_executables = [] if auto_terminate is False else utils.are_executables_running_in_folder(mq_folder)
         if running_executables:
-            auto_terminate = config.settings.from_env(self.current_env).get('AUTO_TERMINATE_PROCESSES', None)
             if auto_terminate is True:
                 utils.terminate_executables_in_folder(mq_folder)
-            elif auto_terminate is False:
-                self.notify("Continuing update without closing processes...", severity="warning")
             else:
                 # We need to switch to the main thread to show the modal
                 response = self.call_from_thread(
@@ -981,24 +980,24 @@ class Redfetch(App):
                 cursor = conn.cursor()
                 if resource_ids:
                     # Reset download date for specific resources
-                    for resource_id in resource_ids:
-                        reset_success = self.reset_download_date(cursor, resource_id)
-                        if not reset_success:
-                            print(f"Failed to reset download date for resource ID: {resource_id}")
-                            return False
+                    reset_success = self.reset_download_dates(cursor, resource_ids)
+                    if not reset_success:
+                        print(f"Failed to reset download dates for resource IDs: {resource_ids}")
+                        return False
                 # Proceed with synchronization and download
                 result = synchronize_db_and_download(cursor, headers, resource_ids=resource_ids, worker=worker)
-                return result
+            db.checkpoint_wal_if_large(db_name)
+            return result
         except Exception as e:
             print(f"Error in run_synchronization: {e}")
             return False
         
-    def reset_download_date(self, cursor, resource_id):
+    def reset_download_dates(self, cursor, resource_ids):
         try:
-            db.reset_download_date_for_resource(cursor, resource_id)
+            db.reset_download_dates_for_resources(cursor, resource_ids)
             return True
         except Exception as e:
-            print(f"Error during resetting download date for resource ID {resource_id}: {str(e)}")
+            print(f"Error during resetting download dates for resource IDs {resource_ids}: {str(e)}")
             return False
 
     def update_complete(self, result: bool, button: Button):
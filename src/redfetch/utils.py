@@ -5,12 +5,13 @@ import re
 from urllib.parse import urlparse
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Third-party
 import requests
 from rich.prompt import Prompt, InvalidResponse
-import psutil
 
 # Local
 from redfetch import config
@@ -42,47 +43,86 @@ class TerminationPrompt(Prompt):
         else:
             raise InvalidResponse(self.validate_error_message)
 
+# (settings object, ENV, settings_version, index) for the last special resources index built
+_special_index_cache = None
+
+def _build_special_index(special_resources):
+    """Walk SPECIAL_RESOURCES once and precompute the opt-in lookups."""
+    special_ids = tuple(res_id for res_id, details in special_resources.items() if details.get('opt_in', False))
+    opted_in = frozenset(special_ids)
+
+    # A dependency counts as opted in if any opted-in parent opts it in
+    opted_in_deps = set()
+    for parent_id in special_ids:
+        for dep_id, dep_details in special_resources[parent_id].get('dependencies', {}).items():
+            if dep_details and dep_details.get('opt_in', False):
+                opted_in_deps.add(dep_id)
+
+    dependency_parents = {}
+    parent_deps = {}
+    for parent_id in special_ids:
+        deps = tuple(dep_id for dep_id in special_resources[parent_id].get('dependencies', {}) if dep_id in opted_in_deps)
+        parent_deps[parent_id] = deps
+        for dep_id in deps:
+            dependency_parents.setdefault(dep_id, []).append(parent_id)
+    # Frozen so callers can share them without copying
+    dependency_parents = {dep_id: tuple(parents) for dep_id, parents in dependency_parents.items()}
+
+    # (parent_id or None, resource_id) -> flatten, a parent's per-dependency setting wins over the resource's own
+    flatten_map = {}
+    for res_id, details in special_resources.items():
+        if 'flatten' in details:
+            flatten_map[(None, res_id)] = details['flatten']
+        for dep_id, dep_details in details.get('dependencies', {}).items():
+            if dep_details and 'flatten' in dep_details:
+                flatten_map[(res_id, dep_id)] = dep_details['flatten']
+
+    return {
+        'special_ids': special_ids,
+        'opted_in': opted_in,
+        'opted_in_deps': frozenset(opted_in_deps),
+        'dependency_parents': dependency_parents,
+        'parent_deps': parent_deps,
+        'flatten_map': flatten_map,
+    }
+
+def get_special_index():
+    """Return the special resources index for the current environment, rebuilding it only when settings change."""
+    global _special_index_cache
+    settings = config.settings
+    env = settings.ENV
+    cached = _special_index_cache
+    if cached and cached[0] is settings and cached[1] == env and cached[2] == config.settings_version:
+        return cached[3]
+    index = _build_special_index(settings.from_env(env).SPECIAL_RESOURCES)
+    _special_index_cache = (settings, env, config.settings_version, index)
+    return index
+
 def is_special_or_dependency(resource_id):
     """Determine if a resource is special or a dependency, and its parent IDs."""
-    is_special = is_resource_opted_in(resource_id)
-    is_dependency = False
-    parent_ids = []
+    index = get_special_index()
+    is_special = resource_id in index['opted_in']
+    parent_ids = list(index['dependency_parents'].get(resource_id, ()))
+    is_dependency = bool(parent_ids)
 
     if is_special:
         print(f"{resource_id} is special")
-
-    # Check if it's a dependency of any opted-in special resource
-    special_resources = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES
-    for parent_id, parent_details in special_resources.items():
-        if is_resource_opted_in(parent_id):
-            dependencies = parent_details.get('dependencies', {})
-            if resource_id in dependencies:
-                if is_dependency_opted_in(resource_id):
-                    is_dependency = True
-                    parent_ids.append(parent_id)
-                    print(f"{resource_id} is a dependency of {parent_id}")
+    for parent_id in parent_ids:
+        print(f"{resource_id} is a dependency of {parent_id}")
 
     return is_special, is_dependency, parent_ids
 
 def get_opted_in_special_resources_and_dependencies():
     """Retrieve all opted-in special resources and their opted-in dependencies."""
-    special_resources = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES
-
-    resource_ids = set()
-    for res_id in special_resources:
-        if is_resource_opted_in(res_id):
-            resource_ids.add(res_id)
-            # Add opted-in dependencies
-            dependencies = special_resources[res_id].get('dependencies', {})
-            for dep_id in dependencies:
-                if is_dependency_opted_in(dep_id):
-                    resource_ids.add(dep_id)
+    index = get_special_index()
+    resource_ids = set(index['opted_in'])
+    for deps in index['parent_deps'].values():
+        resource_ids.update(deps)
     return resource_ids
 
 def get_special_resource_ids_only():
     """Extracts all unique opted-in special resource IDs from special_resources, excluding dependencies."""
-    special_resources = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES
-    return [res_id for res_id, details in special_resources.items() if details.get('opt_in', False)]
+    return list(get_special_index()['special_ids'])
 
 def filter_and_fetch_dependencies(resource_ids=None):
     """Fetches opted-in resources and their dependencies."""
@@ -90,21 +130,18 @@ def filter_and_fetch_dependencies(resource_ids=None):
         # Fetch all opted-in special resources and their dependencies
         resource_ids = get_opted_in_special_resources_and_dependencies()
     else:
-        resource_ids = set(resource_ids)
+        # SPECIAL_RESOURCES is keyed by strings, and IDs parsed from URLs arrive as ints; convert each once
+        resource_ids = {str(res_id) for res_id in resource_ids}
         # Include opted-in dependencies of the provided resource IDs
         resource_ids.update(get_dependencies_for_resources(resource_ids))
     return resource_ids
 
 def get_dependencies_for_resources(resource_ids):
     """Retrieve opted-in dependencies for the given resource IDs."""
-    special_resources = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES
+    parent_deps = get_special_index()['parent_deps']
     dependencies = set()
     for res_id in resource_ids:
-        if is_resource_opted_in(res_id):
-            deps = special_resources[res_id].get('dependencies', {})
-            for dep_id in deps:
-                if is_dependency_opted_in(dep_id):
-                    dependencies.add(dep_id)
+        dependencies.update(parent_deps.get(res_id, ()))
     return dependencies
 
 def is_mq_down():
@@ -131,22 +168,11 @@ def is_mq_down():
 
 def is_resource_opted_in(resource_id):
     """Check if the given resource is opted-in."""
-    special_resources = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES
-    resource_details = special_resources.get(resource_id)
-    return resource_details.get('opt_in', False) if resource_details else False
+    return resource_id in get_special_index()['opted_in']
 
 def is_dependency_opted_in(resource_id):
     """Check if the given resource is an opted-in dependency of any opted-in parent resource."""
-    special_resources = config.settings.from_env(config.settings.ENV).SPECIAL_RESOURCES
-
-    for parent_id, parent_details in special_resources.items():
-        if parent_details.get('opt_in', False):
-            dependencies = parent_details.get('dependencies', {})
-            dep_details = dependencies.get(resource_id)
-            if dep_details and dep_details.get('opt_in', False):
-                return True
-
-    return False
+    return resource_id in get_special_index()['opted_in_deps']
 
 #
 # path functions
@@ -334,107 +360,197 @@ def parse_resource_id(input_string):
         print(f"Could not find a valid resource ID in the URL")
         raise ValueError("Could not find a valid resource ID in the URL")
 
-def are_executables_running_in_folder(folder_path):
-    """
-    Check if any .exe files in the specified folder are currently running processes.
+def _normalized_executables(folder_path):
+    """Return a frozenset of the lowercased .exe file names in folder_path."""
+    return _list_normalized_executables(folder_path, os.stat(folder_path).st_mtime_ns)
+
+@lru_cache(maxsize=8)
+def _list_normalized_executables(folder_path, mtime_ns):
+    # mtime_ns is only part of the cache key, so adding or removing an .exe invalidates the entry
+    # scandir's entries carry the file type from the directory listing, so is_file() needs no extra stat on Windows
+    with os.scandir(folder_path) as entries:
+        return frozenset(
+            entry.name.lower() for entry in entries if entry.name[-4:].lower() == '.exe' and entry.is_file()
+        )
 
-    Returns a list of running executables in the folder.
-    """
-    if not sys.platform == 'win32':
-        return []  # Return empty list for non-Windows platforms
-        
-    running_executables = []
-    try:
-        # Get the absolute, normalized path of the folder
-        folder_path = os.path.normpath(os.path.abspath(folder_path))
-        # List all .exe files in the folder
-        exe_files = [os.path.normcase(os.path.join(folder_path, f)) for f in os.listdir(folder_path) if f.lower().endswith('.exe')]
-        if not exe_files:
-            print(f"No executable files found in {folder_path}")
+# Process checks and launching are Windows-only, so bind the real implementations once at import
+if sys.platform == 'win32':
+    import ctypes
+    import ctypes.wintypes
+
+    import psutil
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ('dwSize', ctypes.wintypes.DWORD),
+            ('cntUsage', ctypes.wintypes.DWORD),
+            ('th32ProcessID', ctypes.wintypes.DWORD),
+            ('th32DefaultHeapID', ctypes.c_size_t),
+            ('th32ModuleID', ctypes.wintypes.DWORD),
+            ('cntThreads', ctypes.wintypes.DWORD),
+            ('th32ParentProcessID', ctypes.wintypes.DWORD),
+            ('pcPriClassBase', ctypes.wintypes.LONG),
+            ('dwFlags', ctypes.wintypes.DWORD),
+            ('szExeFile', ctypes.wintypes.WCHAR * ctypes.wintypes.MAX_PATH),
+        ]
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32FirstW.restype = ctypes.wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.restype = ctypes.wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+
+    def snapshot_process_names():
+        """Return (pid, exe name) for every process from a single ToolHelp32 snapshot."""
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if snapshot == INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            processes = []
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            has_entry = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while has_entry:
+                processes.append((entry.th32ProcessID, entry.szExeFile))
+                has_entry = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+            return processes
+        finally:
+            kernel32.CloseHandle(snapshot)
+
+    def _resolve_process_exe(pid):
+        """Return (process, exe path) for pid, or None if it exited or can't be inspected."""
+        try:
+            proc = psutil.Process(pid)
+            return proc, proc.exe()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+    def _iter_processes_in_folder(folder_path, exe_files):
+        """Yield (process, exe path) for running processes launched from one of exe_files in folder_path."""
+        folder_prefix = folder_path.lower().rstrip(os.sep) + os.sep
+        prefix_length = len(folder_prefix)
+        try:
+            # The snapshot already carries each process's exe name, so only matching names need a full path lookup
+            candidate_pids = [pid for pid, name in snapshot_process_names() if name.lower() in exe_files]
+        except OSError as e:
+            print(f"Process snapshot failed, falling back to a full process scan: {e}")
+            candidate_pids = psutil.pids()
+
+        # Each exe lookup opens a process handle; overlap them when there's more than one to resolve
+        if len(candidate_pids) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(candidate_pids))) as executor:
+                resolved = list(executor.map(_resolve_process_exe, candidate_pids))
+        else:
+            resolved = [_resolve_process_exe(pid) for pid in candidate_pids]
+
+        for result in resolved:
+            if result is None:
+                continue
+            proc, exe_path = result
+            # psutil reports absolute, backslashed paths, so lower() is all normcase would do on Windows
+            exe_path_lower = exe_path.lower() if exe_path else ''
+            if exe_path_lower.startswith(folder_prefix) and exe_path_lower[prefix_length:] in exe_files:
+                yield proc, exe_path
+
+    def are_executables_running_in_folder(folder_path):
+        """
+        Check if any .exe files in the specified folder are currently running processes.
+
+        Returns a list of running executables in the folder.
+        """
+        running_executables = []
+        try:
+            # Get the absolute, normalized path of the folder
+            folder_path = os.path.normpath(os.path.abspath(folder_path))
+            exe_files = _normalized_executables(folder_path)
+            if not exe_files:
+                print(f"No executable files found in {folder_path}")
+                return running_executables
+
+            # Iterate over the running processes from this folder
+            for proc, exe_path in _iter_processes_in_folder(folder_path, exe_files):
+                print(f"Process '{exe_path}' (PID {proc.pid}) is currently running.")
+                running_executables.append((proc.pid, exe_path))
+            return running_executables
+        except Exception as e:
+            print(f"An error occurred while checking running processes: {e}")
             return running_executables
 
-        # Iterate over all running processes
-        for proc in psutil.process_iter(['pid', 'exe', 'name']):
+    def terminate_executables_in_folder(folder_path):
+        """
+        Attempt to terminate any running .exe files in the specified folder and then unload MacroQuest.
+        """
+        try:
+            # Get the absolute, normalized path of the folder
+            folder_path = os.path.normpath(os.path.abspath(folder_path))
+            exe_files = _normalized_executables(folder_path)
+            if not exe_files:
+                print(f"No executable files found in {folder_path}")
+                return
+
+            # Ask every running process from this folder to terminate
+            exe_paths = {}
+            for proc, exe_path in _iter_processes_in_folder(folder_path, exe_files):
+                try:
+                    proc.terminate()
+                    exe_paths[proc] = exe_path
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
+                    print(f"Could not terminate process: {e}")
+
+            # Wait on all of them together, so the timeout is shared rather than 5 seconds per process
+            gone, alive = psutil.wait_procs(list(exe_paths), timeout=5)
+            for proc in gone:
+                print(f"Terminated process '{exe_paths[proc]}' (PID {proc.pid}).")
+            for proc in alive:
+                print(f"Could not terminate process '{exe_paths[proc]}' (PID {proc.pid}): still running after 5 seconds.")
+
+            # Unload MacroQuest after terminating executables
             try:
-                exe_path = proc.info['exe']
-                if exe_path and os.path.isfile(exe_path):
-                    # Normalize the path for comparison
-                    exe_path_normalized = os.path.normcase(os.path.normpath(exe_path))
-                    if exe_path_normalized in exe_files:
-                        print(f"Process '{exe_path}' (PID {proc.pid}) is currently running.")
-                        running_executables.append((proc.pid, exe_path))
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-        return running_executables
-    except Exception as e:
-        print(f"An error occurred while checking running processes: {e}")
-        return running_executables
-
-def terminate_executables_in_folder(folder_path):
-    """
-    Attempt to terminate any running .exe files in the specified folder and then unload MacroQuest.
-    Only works on Windows, does nothing on other platforms.
-    """
-    if sys.platform != 'win32':
-        print("Terminating executables is only supported on Windows platforms.")
-        return
+                force_remote_unload()
+            except Exception as e:
+                print(f"Error unloading MacroQuest: {e}")
 
-    try:
-        # Get the absolute, normalized path of the folder
-        folder_path = os.path.normpath(os.path.abspath(folder_path))
-        # List all .exe files in the folder
-        exe_files = [os.path.normcase(os.path.join(folder_path, f)) for f in os.listdir(folder_path) if f.lower().endswith('.exe')]
-        if not exe_files:
-            print(f"No executable files found in {folder_path}")
-            return
-
-        # Iterate over all running processes
-        for proc in psutil.process_iter(['pid', 'exe', 'name']):
-            try:
-                exe_path = proc.info['exe']
-                if exe_path and os.path.isfile(exe_path):
-                    # Normalize the path for comparison
-                    exe_path_normalized = os.path.normcase(os.path.normpath(exe_path))
-                    if exe_path_normalized in exe_files:
-                        # Terminate the process
-                        proc.terminate()
-                        proc.wait(timeout=5)
-                        print(f"Terminated process '{exe_path}' (PID {proc.pid}).")
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-                print(f"Could not terminate process: {e}")
-
-        # Unload MacroQuest after terminating executables
-        try:
-            force_remote_unload()
         except Exception as e:
-            print(f"Error unloading MacroQuest: {e}")
+            print(f"An error occurred while terminating processes: {e}")
 
-    except Exception as e:
-        print(f"An error occurred while terminating processes: {e}")
+    def run_executable(folder_path: str, executable_name: str, args=None) -> bool:
+        """Run an executable from a specified folder. Use args if you need to pass arguments to the executable."""
+        if not folder_path:
+            print(f"Folder path not set for {executable_name}")
+            return False
 
-def run_executable(folder_path: str, executable_name: str, args=None) -> bool:
-    """Run an executable from a specified folder. Use args if you need to pass arguments to the executable."""
-    if not sys.platform.startswith('win'):
-        print("Running executables is only supported on Windows.")
-        return False
+        executable_path = os.path.join(folder_path, executable_name)
+        if os.path.isfile(executable_path):
+            try:
+                if not args:
+                    # Fire-and-forget through ShellExecute, no Popen handle or pipes kept in this process
+                    os.startfile(executable_path, cwd=folder_path)
+                else:
+                    subprocess.Popen([executable_path] + args, cwd=folder_path)
+                print(f"{executable_name} started successfully.")
+                return True
+            except Exception as e:
+                print(f"Failed to start {executable_name}: {e}")
+                return False
+        else:
+            print(f"{executable_name} not found in the specified folder.")
+            return False
+else:
+    def are_executables_running_in_folder(folder_path):
+        """Nothing is tracked outside Windows, so no executables are ever reported as running."""
+        return []
 
-    if not folder_path:
-        print(f"Folder path not set for {executable_name}")
-        return False
+    def terminate_executables_in_folder(folder_path):
+        print("Terminating executables is only supported on Windows platforms.")
 
-    executable_path = os.path.join(folder_path, executable_name)
-    if os.path.isfile(executable_path):
-        try:
-            if args is None:
-                args = []
-            subprocess.Popen([executable_path] + args, cwd=folder_path)
-            print(f"{executable_name} started successfully.")
-            return True
-        except Exception as e:
-            print(f"Failed to start {executable_name}: {e}")
-            return False
-    else:
-        print(f"{executable_name} not found in the specified folder.")
+    def run_executable(folder_path: str, executable_name: str, args=None) -> bool:
+        print("Running executables is only supported on Windows.")
         return False
 
 def validate_file_in_path(path: str | None, filename: str) -> bool:
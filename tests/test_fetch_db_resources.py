@@ -0,0 +1,67 @@
+import pytest
+from redfetch import db
+
+DB_NAME = 'test_resources.db'
+
+@pytest.fixture
+def cursor(tmp_path, monkeypatch):
+    # Point the database at a temporary config dir
+    monkeypatch.setenv('REDFETCH_CONFIG_DIR', str(tmp_path))
+    db.initialize_db(DB_NAME)
+    conn = db.get_db_connection(DB_NAME)
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO resources (resource_id, parent_category_id, remote_version, local_version, download_url, filename) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (151, 8, 20, 10, 'https://example.com/151', 'mq.zip'),
+            (1974, 11, 5, 5, 'https://example.com/1974', 'lua.zip'),
+            (303, 8, 3, 0, 'https://example.com/303', 'macro.zip'),
+        ],
+    )
+    cursor.executemany(
+        "INSERT INTO dependencies (parent_resource_id, dependency_resource_id, remote_version, local_version, download_url, filename) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (151, 153, 7, 7, 'https://example.com/153', 'maps.zip'),
+            (303, 151, 20, 0, 'https://example.com/151', 'mq.zip'),
+        ],
+    )
+    conn.commit()
+    yield cursor
+    conn.close()
+
+def test_fetch_db_resources_request_order(cursor):
+    # Each resource is followed by its dependencies, in the order the IDs were requested
+    rows = db.fetch_db_resources(['303', '1974', '151'], cursor)
+    assert rows == [
+        (303, 8, 3, 0, None, 'https://example.com/303', 'macro.zip'),
+        (151, 8, 20, 0, 303, 'https://example.com/151', 'mq.zip'),
+        (1974, 11, 5, 5, None, 'https://example.com/1974', 'lua.zip'),
+        (151, 8, 20, 10, None, 'https://example.com/151', 'mq.zip'),
+        (153, 8, 7, 7, 151, 'https://example.com/153', 'maps.zip'),
+    ]
+
+def test_fetch_db_resources_skips_missing_ids(cursor):
+    rows = db.fetch_db_resources([9999, 1974, 8888], cursor)
+    assert rows == [(1974, 11, 5, 5, None, 'https://example.com/1974', 'lua.zip')]
+
+def test_fetch_db_resources_dependency_without_own_row(cursor):
+    # 153 has no resources row, so it only comes back as 151's dependency
+    rows = db.fetch_db_resources([153, 151], cursor)
+    assert rows == [
+        (151, 8, 20, 10, None, 'https://example.com/151', 'mq.zip'),
+        (153, 8, 7, 7, 151, 'https://example.com/153', 'maps.zip'),
+    ]
+
+def test_fetch_db_resources_more_ids_than_one_statement(cursor):
+    # 602 IDs bind 1204 parameters, so they are split across statements without losing the request order
+    resource_ids = list(range(10000, 10600)) + [151, 303]
+    rows = db.fetch_db_resources(resource_ids, cursor)
+    assert rows == [
+        (151, 8, 20, 10, None, 'https://example.com/151', 'mq.zip'),
+        (153, 8, 7, 7, 151, 'https://example.com/153', 'maps.zip'),
+        (303, 8, 3, 0, None, 'https://example.com/303', 'macro.zip'),
+        (151, 8, 20, 0, 303, 'https://example.com/151', 'mq.zip'),
+    ]
+
+def test_fetch_db_resources_empty(cursor):
+    assert db.fetch_db_resources([], cursor) == []
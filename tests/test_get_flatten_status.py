@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import MagicMock
+from redfetch import download
+
+# 153 flattens on its own, but 151 asks for it unflattened; 1865 only has a setting under 151
+special_resources_mock = {
+    '151': {
+        'opt_in': True,
+        'dependencies': {
+            '153': {'subfolder': 'maps', 'flatten': False, 'opt_in': True},
+            '1865': {'subfolder': '', 'flatten': True, 'opt_in': True}
+        }
+    },
+    '153': {'opt_in': True, 'flatten': True, 'dependencies': {}},
+    '1974': {'opt_in': True, 'dependencies': {}},
+}
+
+@pytest.fixture(autouse=True)
+def mock_first_run_setup(mocker):
+    # Mock the first_run_setup function to return a dummy config dir
+    mock_setup = mocker.patch('redfetch.config.first_run_setup')
+    mock_setup.return_value = '/dummy/config/dir'
+    return mock_setup
+
+@pytest.fixture
+def mock_config(mocker):
+    # A fresh settings mock per test, so the cached special index is rebuilt
+    mock_settings = MagicMock()
+    mock_env_settings = MagicMock()
+    mock_env_settings.SPECIAL_RESOURCES = special_resources_mock
+    mock_settings.from_env.return_value = mock_env_settings
+    mock_settings.ENV = 'test'
+    mocker.patch('redfetch.config.settings', mock_settings)
+    return mock_settings
+
+def test_flatten_status_parent_setting_wins(mock_config):
+    # The parent's per-dependency setting overrides the resource's own
+    assert download.get_flatten_status('153', True, '151') == False
+
+def test_flatten_status_own_setting(mock_config):
+    assert download.get_flatten_status('153', False, None) == True
+
+def test_flatten_status_parent_without_setting_falls_back(mock_config):
+    # 1974 has no setting for 153, so 153's own setting applies
+    assert download.get_flatten_status(153, True, 1974) == True
+
+def test_flatten_status_dependency_only_setting(mock_config):
+    assert download.get_flatten_status('1865', True, '151') == True
+    assert download.get_flatten_status('1865', False, None) == False
+
+def test_flatten_status_default(mock_config):
+    assert download.get_flatten_status('1974', False, None) == False
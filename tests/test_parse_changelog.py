@@ -0,0 +1,66 @@
+import pytest
+from redfetch import push
+
+# A keepachangelog-style file mixing bracketed and unbracketed release headers
+changelog_sample = """# Changelog
+
+All notable changes to this project will be documented in this file.
+
+## [Unreleased]
+
+### Added
+- Work in progress
+
+## [1.2.0] - 2024-03-01
+
+### ADDED
+- New feature
+- Another feature
+
+### fixed
+- A bug
+
+## 1.1.0 - 2024-02-01
+
+### Changed
+- Something changed
+
+## [1.0.0] - 2024-01-01
+
+### Added
+- First release
+
+[1.2.0]: https://example.com/compare/v1.1.0...v1.2.0
+[1.0.0]: https://example.com/releases/v1.0.0
+"""
+
+@pytest.fixture
+def changelog_path(tmp_path):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(changelog_sample, encoding="utf-8")
+    return str(path)
+
+@pytest.fixture
+def mock_convert(mocker):
+    # Return the markdown unchanged so the tests can check what would be sent to md2bbcode
+    return mocker.patch('redfetch.push.convert_markdown_to_bbcode', side_effect=lambda markdown, domain=None: markdown)
+
+def test_parse_changelog_bracketed_header(changelog_path, mock_convert):
+    # A bracketed header ends at the next release, and subsection names are capitalized
+    message = push.parse_changelog(changelog_path, 'v1.2.0', domain='https://example.com')
+    assert message == "### Added\n- New feature\n- Another feature\n\n### Fixed\n- A bug"
+    mock_convert.assert_called_once_with(message, domain='https://example.com')
+
+def test_parse_changelog_unbracketed_header(changelog_path, mock_convert):
+    message = push.parse_changelog(changelog_path, '1.1.0')
+    assert message == "### Changed\n- Something changed"
+
+def test_parse_changelog_last_release_skips_link_definitions(changelog_path, mock_convert):
+    # The last release runs to the end of the file, minus the link definitions
+    message = push.parse_changelog(changelog_path, '1.0.0')
+    assert message == "### Added\n- First release"
+
+def test_parse_changelog_missing_version(changelog_path, mock_convert):
+    with pytest.raises(ValueError, match="Version v9.9.9 not found"):
+        push.parse_changelog(changelog_path, 'v9.9.9')
+    mock_convert.assert_not_called()
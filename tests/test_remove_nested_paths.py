@@ -0,0 +1,28 @@
+import os
+from redfetch.meta import remove_nested_paths
+
+def test_remove_nested_paths_drops_subfolders(tmp_path):
+    a = os.path.join(str(tmp_path), 'a')
+    a_b = os.path.join(a, 'b')
+    a_b_c = os.path.join(a_b, 'c')
+    assert remove_nested_paths({a_b_c, a, a_b}) == {a}
+
+def test_remove_nested_paths_keeps_siblings(tmp_path):
+    a = os.path.join(str(tmp_path), 'a')
+    b = os.path.join(str(tmp_path), 'b')
+    assert remove_nested_paths({a, b, os.path.join(b, 'c')}) == {a, b}
+
+def test_remove_nested_paths_keeps_prefix_named_folders(tmp_path):
+    # "a b" starts with "a" but isn't inside it
+    a = os.path.join(str(tmp_path), 'a')
+    a_b = os.path.join(a, 'b')
+    a_space_b = os.path.join(str(tmp_path), 'a b')
+    assert remove_nested_paths({a, a_b, a_space_b}) == {a, a_space_b}
+
+def test_remove_nested_paths_trailing_separator(tmp_path):
+    a = os.path.join(str(tmp_path), 'a') + os.sep
+    a_b = os.path.join(str(tmp_path), 'a', 'b')
+    assert remove_nested_paths({a, a_b}) == {a}
+
+def test_remove_nested_paths_empty():
+    assert remove_nested_paths(set()) == set()